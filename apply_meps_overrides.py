@@ -12,20 +12,26 @@ Behavior:
 - For each override entry:
   - If the id exists in the base list, update that object with all override keys.
   - If the id does NOT exist in the base list, create a new stub object and append it.
+
+Output format:
+- Serialized with orjson using OPT_INDENT_2. Minified output would be smaller and
+  a bit faster to write, but the file is committed and checked by hand, so it
+  stays indented.
 """
 
-import json
+from collections import Counter
 from pathlib import Path
 from urllib.parse import urlparse
 
+import orjson
+
 BASE_FILE = Path("data/meps_all.json")
 OVERRIDES_FILE = Path("data/meps_overrides.json")
 OUTPUT_FILE = Path("data/meps_all_with_overrides.json")
 
 
 def load_json(path: Path):
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(path.read_bytes())
 
 
 def main():
@@ -42,14 +48,15 @@ def main():
     if not isinstance(overrides, dict):
         raise SystemExit("meps_overrides.json must be a JSON object keyed by MEP id.")
 
-    # Index base data by id for fast lookup
-    index = {}
-    for obj in base_data:
-        obj_id = obj.get("id")
-        if obj_id:
-            if obj_id in index:
+    # Index base data by id for fast lookup (the last duplicate wins)
+    index = {obj["id"]: obj for obj in base_data if obj.get("id")}
+
+    # Only look for duplicates when the index came out smaller than expected
+    if len(index) != sum(1 for obj in base_data if obj.get("id")):
+        id_counts = Counter(obj["id"] for obj in base_data if obj.get("id"))
+        for obj_id, count in id_counts.items():
+            if count > 1:
                 print(f"[WARN] Duplicate id in base data: {obj_id}")
-            index[obj_id] = obj
 
     def _extract_handle(v):
         if v is None:
@@ -111,6 +118,7 @@ def main():
         normalize_x_fields(obj)
 
     # Apply overrides
+    new_stubs = []
     for mep_id, override_data in overrides.items():
         if not isinstance(override_data, dict):
             print(f"[WARN] Override for {mep_id} is not an object, skipping.")
@@ -127,12 +135,13 @@ def main():
             # Create a new minimal object and append it
             new_obj = {"id": mep_id}
             new_obj.update(override_data)
-            base_data.append(new_obj)
+            new_stubs.append(new_obj)
             index[mep_id] = new_obj
 
+    base_data.extend(new_stubs)
+
     # Write merged output
-    with OUTPUT_FILE.open("w", encoding="utf-8") as f:
-        json.dump(base_data, f, ensure_ascii=False, indent=2)
+    OUTPUT_FILE.write_bytes(orjson.dumps(base_data, option=orjson.OPT_INDENT_2))
 
     print(f"[INFO] Wrote merged data with overrides to {OUTPUT_FILE}")
     print(f"[INFO] Total records: {len(base_data)}")
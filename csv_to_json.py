@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import csv
-import json
+
+import orjson
 
 INPUT_CSV = "data/meps_all.csv"
 OUTPUT_JSON = "data/meps_all.json"
@@ -126,8 +127,9 @@ def main():
 
             data.append(mep_obj)
 
-    with open(OUTPUT_JSON, "w", encoding="utf-8") as out:
-        json.dump(data, out, ensure_ascii=False, indent=2)
+    # Indented rather than minified so diffs of the committed file stay readable
+    with open(OUTPUT_JSON, "wb") as out:
+        out.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
     print(f"[INFO] Wrote {len(data)} records to {OUTPUT_JSON}")
 
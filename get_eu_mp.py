@@ -11,26 +11,57 @@ Scrape the European Parliament MEP list and extract, for each MEP:
 Output: meps.csv (semicolon-separated by default).
 
 Requirements:
-    pip install requests beautifulsoup4
+    pip install requests requests-cache lxml
+
+Fetched pages are cached in data/ep_cache.sqlite for 7 days; use --refresh
+to start from an empty cache.
 """
 
+import asyncio
 import csv
-import re
+import random
+import threading
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from datetime import timedelta
+from operator import attrgetter
 from typing import List, Optional, Dict, Tuple
 from urllib.parse import urljoin, urlparse
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
 
 BASE_URL = "https://www.europarl.europa.eu"
 FULL_LIST_URL = f"{BASE_URL}/meps/en/full-list/all"
 
 # Be polite to the EP website – adjust if needed
-REQUEST_DELAY_SECONDS = 0.2
+REQUEST_DELAY_SECONDS = 0.2   # max random jitter per network request
+MAX_REQUESTS_PER_SECOND = 5   # overall request rate across all workers
+MAX_WORKERS = 8
 TIMEOUT = 15
 
+# On-disk HTTP cache; server Cache-Control/ETag headers take precedence over the TTL
+CACHE_NAME = "data/ep_cache"
+CACHE_EXPIRE_AFTER = timedelta(days=7)
+
+# One shared session so HTTPS connections are reused across requests
+SESSION = CachedSession(
+    CACHE_NAME,
+    backend="sqlite",
+    expire_after=CACHE_EXPIRE_AFTER,
+    cache_control=True,
+    # Never store empty bodies, or a bad response would be reused for the whole TTL
+    # (the synthetic 504 from only_if_cached has no content at all)
+    filter_fn=lambda resp: bool((resp.content or b"").strip()),
+)
+SESSION.headers.update({
+    "User-Agent": "LeaveXContactScraper/1.0 (+https://leavex.eu)"
+})
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
 
 @dataclass
 class MEP:
@@ -46,13 +77,88 @@ class MEP:
     country_and_national_party: Optional[str]
 
 
+def _has_class(*classes: str) -> str:
+    """XPath predicate matching elements that carry all the given CSS classes."""
+    return " and ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {c} ')" for c in classes
+    )
+
+
+# Compiled once at import time and reused for every page. smart_strings=False
+# returns plain str results instead of objects that keep the tree alive.
+def _xpath(expr: str) -> etree.XPath:
+    return etree.XPath(expr, smart_strings=False)
+
+
+XP_MEP_HREFS = _xpath("//a[contains(@href, '/meps/en/')]/@href")
+XP_H1 = _xpath("(//h1)[1]//text()")
+XP_GROUP = _xpath(
+    f"(//h3[{_has_class('erpl_title-h3', 'mt-1', 'sln-political-group-name')}])[1]//text()"
+)
+XP_COUNTRY = _xpath(
+    f"(//div[{_has_class('erpl_title-h3', 'mt-1', 'mb-1')}])[1]//text()"
+)
+XP_EMAIL = _xpath(f"(//a[{_has_class('link_email')}])[1]/@href")
+XP_TWITT = _xpath(f"(//a[{_has_class('link_twitt')}])[1]/@href")
+
+
+_parser_local = threading.local()
+
+
+def _html_parser() -> lxml.html.HTMLParser:
+    """Per-thread UTF-8 HTML parser (lxml serializes parses on a shared parser)."""
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _parser_local.parser = lxml.html.HTMLParser(encoding="utf-8")
+    return parser
+
+
+def _parse_html(html: str) -> Optional[lxml.html.HtmlElement]:
+    """Parse an HTML page with lxml; returns None for empty or unparseable input."""
+    # requests has already decoded the body; hand lxml UTF-8 bytes with the
+    # encoding fixed, so any <?xml ... encoding=...?> declaration is accepted
+    # without overriding the charset.
+    try:
+        return lxml.html.fromstring(html.encode("utf-8"), parser=_html_parser())
+    except etree.ParserError:
+        # Empty, whitespace-only or comment-only body
+        return None
+
+
+def _join_text(nodes: List[str], sep: str = "") -> str:
+    """Join stripped, non-empty text nodes (like BeautifulSoup's get_text(strip=True))."""
+    return sep.join(s for s in (t.strip() for t in nodes) if s)
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing out calls to at most `rate` per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+RATE_LIMITER = RateLimiter(MAX_REQUESTS_PER_SECOND)
+
+
 def fetch(url: str) -> Optional[str]:
     """Fetch a URL and return its text, with basic error handling."""
-    headers = {
-        "User-Agent": "LeaveXContactScraper/1.0 (+https://leavex.eu)"
-    }
     try:
-        resp = requests.get(url, headers=headers, timeout=TIMEOUT)
+        resp = SESSION.get(url, timeout=TIMEOUT, only_if_cached=True)
+        if resp.status_code == 504:
+            # Not cached (or expired): go to the network, politely
+            RATE_LIMITER.wait()
+            time.sleep(random.uniform(0, REQUEST_DELAY_SECONDS))
+            resp = SESSION.get(url, timeout=TIMEOUT)
         resp.raise_for_status()
         return resp.text
     except requests.RequestException as e:
@@ -70,26 +176,26 @@ def get_all_mep_ids_and_urls() -> Dict[str, str]:
     if html is None:
         raise SystemExit("Could not fetch full list page")
 
-    soup = BeautifulSoup(html, "html.parser")
+    tree = _parse_html(html)
+    if tree is None:
+        raise SystemExit("Could not parse full list page")
 
     meps: Dict[str, str] = {}
 
     # Strategy:
-    # - find all <a> tags whose href contains '/meps/en/'
+    # - select only the hrefs of <a> tags that contain '/meps/en/'
     # - extract the numeric ID after '/meps/en/'
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if "/meps/en/" not in href:
-            continue
-
+    for href in XP_MEP_HREFS(tree):
         # Example hrefs:
         #   /meps/en/256810
         #   /meps/en/256810/MIKA_AALTOLA/home
-        m = re.search(r"/meps/en/(\d+)", href)
-        if not m:
+        _, sep, rest = href.partition("/meps/en/")
+        if not sep:
             continue
 
-        mep_id = m.group(1)
+        mep_id = rest.split("/", 1)[0]
+        if not mep_id.isdigit():
+            continue
 
         # Normalize to a canonical profile URL (without name/home; the site redirects)
         profile_url = urljoin(BASE_URL, f"/meps/en/{mep_id}")
@@ -99,6 +205,15 @@ def get_all_mep_ids_and_urls() -> Dict[str, str]:
     return meps
 
 
+# Common X/Twitter URL prefixes handled without urlparse
+X_URL_PREFIXES = (
+    "https://x.com/",
+    "https://twitter.com/",
+    "http://x.com/",
+    "http://twitter.com/",
+)
+
+
 def extract_x_handle_from_url(x_url: str) -> Optional[str]:
     """
     Extract X/Twitter handle from URL like:
@@ -107,6 +222,19 @@ def extract_x_handle_from_url(x_url: str) -> Optional[str]:
     """
     if not x_url:
         return None
+    if x_url.startswith(X_URL_PREFIXES):
+        # Fast path: everything after the host, up to any query/fragment
+        rest = x_url.split("/", 3)[3]
+        path = rest.split("?", 1)[0].split("#", 1)[0]
+        # Like urlparse, drop ';params' from the last path segment
+        head, slash, last = path.rpartition("/")
+        path = head + slash + last.split(";", 1)[0]
+        return path.strip("/").split("/", 1)[0] or None
+    return _extract_x_handle_slow(x_url)
+
+
+def _extract_x_handle_slow(x_url: str) -> Optional[str]:
+    """Fallback for unusual X/Twitter URLs, using full URL parsing."""
     try:
         path = urlparse(x_url).path  # e.g. '/MikaAaltola'
         if not path:
@@ -117,49 +245,37 @@ def extract_x_handle_from_url(x_url: str) -> Optional[str]:
         return None
 
 
-def parse_mep_profile(mep_id: str, url: str) -> Optional[MEP]:
-    """Parse a single MEP profile page and extract relevant fields."""
-    print(f"[INFO] Fetching MEP {mep_id}: {url}")
-    html = fetch(url)
-    if html is None:
-        return None
-
-    soup = BeautifulSoup(html, "html.parser")
-
-    # Name: top of the page, usually as plain text or an <h1>.
-    # We'll try several approaches to be robust.
-    name = ""
-    # Try an <h1> with the name
-    h1 = soup.find("h1")
-    if h1 and h1.get_text(strip=True):
-        name = h1.get_text(strip=True)
-    else:
-        # Fallback: first strong text near top with typical structure
-        # For your own debugging, you might want to print some text snippets here.
-        # As a generic fallback, we search for the member name by looking at the
-        # first big text chunk above the political group.
-        text_candidates = soup.find_all(string=True)
-        for t in text_candidates:
-            s = t.strip()
-            if len(s.split()) >= 2 and s.isupper() is False and "Group of the" in soup.get_text():
-                name = s
-                break
-
-    if not name:
-        # Last resort – use the ID itself as name placeholder
-        name = f"MEP-{mep_id}"
+def parse_mep_profile_from_html(mep_id: str, url: str, html: str) -> MEP:
+    """Parse the HTML of a single MEP profile page and extract relevant fields."""
+    tree = _parse_html(html)
+    if tree is None:
+        # Keep the MEP with a placeholder name rather than failing the scrape
+        print(f"[WARN] Could not parse profile page for MEP {mep_id}: {url}")
+        return MEP(
+            mep_id=mep_id,
+            name=f"MEP-{mep_id}",
+            profile_url=url,
+            email=None,
+            x_url=None,
+            x_handle=None,
+            political_group=None,
+            country=None,
+            national_party=None,
+            country_and_national_party=None,
+        )
+
+    # Name: the page's <h1>; use the ID itself as placeholder if it is missing.
+    name = _join_text(XP_H1(tree)) or f"MEP-{mep_id}"
 
     # Political group (party at EU level)
     # HTML example:
     #   <h3 class="erpl_title-h3 mt-1 sln-political-group-name">
     #       Group of the European People's Party (Christian Democrats)
     #   </h3>
-    political_group_el = soup.select_one("h3.erpl_title-h3.mt-1.sln-political-group-name")
-    political_group = political_group_el.get_text(strip=True) if political_group_el else None
+    political_group = _join_text(XP_GROUP(tree)) or None
 
     # Country + national party
-    country_block_el = soup.select_one("div.erpl_title-h3.mt-1.mb-1")
-    raw_country_block = country_block_el.get_text(" ", strip=True) if country_block_el else None
+    raw_country_block = _join_text(XP_COUNTRY(tree), " ") or None
 
     country = None
     national_party = None
@@ -168,21 +284,16 @@ def parse_mep_profile(mep_id: str, url: str) -> Optional[MEP]:
         # Normalize whitespace
         cleaned = " ".join(raw_country_block.split())
         # Expected format: "Finland - Kansallinen Kokoomus (Finland)"
-        if " - " in cleaned:
-            country, nat_party = cleaned.split(" - ", 1)
-            country = country.strip()
-            national_party = nat_party.strip()
-        else:
-            country = cleaned
-            national_party = None
-
+        country, sep, nat_party = cleaned.partition(" - ")
+        country = country.strip()
+        national_party = nat_party.strip() if sep else None
 
     # E-mail
     # <a class="link_email mr-2" href="mailto:mika.aaltola@europarl.europa.eu" ...>
-    email_el = soup.find("a", class_="link_email")
+    email_hrefs = XP_EMAIL(tree)
     email = None
-    if email_el and email_el.has_attr("href"):
-        href = email_el["href"].strip()
+    if email_hrefs:
+        href = email_hrefs[0].strip()
 
         if href.startswith("mailto:"):
             email = href[len("mailto:"):].strip()
@@ -192,11 +303,11 @@ def parse_mep_profile(mep_id: str, url: str) -> Optional[MEP]:
 
     # X / Twitter
     # <a class="link_twitt mr-2" href="https://x.com/MikaAaltola" ...>
-    x_el = soup.find("a", class_="link_twitt")
+    x_hrefs = XP_TWITT(tree)
     x_url = None
     x_handle = None
-    if x_el and x_el.has_attr("href"):
-        x_url = x_el["href"]
+    if x_hrefs:
+        x_url = x_hrefs[0]
         x_handle = extract_x_handle_from_url(x_url)
 
     return MEP(
@@ -213,13 +324,47 @@ def parse_mep_profile(mep_id: str, url: str) -> Optional[MEP]:
     )
 
 
-def scrape_all_meps(only_with_x: bool = False) -> List[MEP]:
-    """Scrape all MEPs, optionally filtering to those who have an X/Twitter account."""
+async def scrape_all_meps_async(only_with_x: bool = False) -> List[MEP]:
+    """
+    Async variant of scrape_all_meps: MAX_WORKERS workers pull profiles from a
+    queue, fetching and then parsing each one in a thread, so parsing overlaps
+    with other workers' fetches. The shared rate limiter keeps the overall pace.
+    """
     meps_meta = get_all_mep_ids_and_urls()
-    results: List[MEP] = []
 
-    for i, (mep_id, url) in enumerate(meps_meta.items(), start=1):
-        mep = parse_mep_profile(mep_id, url)
+    queue: "asyncio.Queue[Tuple[int, str, str]]" = asyncio.Queue()
+    for i, (mep_id, url) in enumerate(meps_meta.items()):
+        queue.put_nowait((i, mep_id, url))
+
+    # Filled by position so the output keeps the full-list order
+    profiles: List[Optional[MEP]] = [None] * len(meps_meta)
+    done = 0
+
+    async def worker() -> None:
+        nonlocal done
+        while True:
+            try:
+                i, mep_id, url = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            print(f"[INFO] Fetching MEP {mep_id}: {url}")
+            # Both the cached requests session and the parser block, so run
+            # them off the loop; other workers keep fetching meanwhile.
+            html = await asyncio.to_thread(fetch, url)
+            if html is not None:
+                profiles[i] = await asyncio.to_thread(
+                    parse_mep_profile_from_html, mep_id, url, html
+                )
+
+            done += 1
+            if done % 10 == 0:
+                print(f"[INFO] Processed {done} MEPs...")
+
+    await asyncio.gather(*(worker() for _ in range(MAX_WORKERS)))
+
+    results: List[MEP] = []
+    for mep in profiles:
         if mep is None:
             continue
 
@@ -229,28 +374,28 @@ def scrape_all_meps(only_with_x: bool = False) -> List[MEP]:
         else:
             results.append(mep)
 
-        # Be nice to the server
-        if i % 10 == 0:
-            print(f"[INFO] Processed {i} MEPs...")
-        time.sleep(REQUEST_DELAY_SECONDS)
-
     print(f"[INFO] Scraping finished. Collected {len(results)} MEPs.")
     return results
 
 
+def scrape_all_meps(only_with_x: bool = False) -> List[MEP]:
+    """Scrape all MEPs, optionally filtering to those who have an X/Twitter account."""
+    return asyncio.run(scrape_all_meps_async(only_with_x=only_with_x))
+
+
 def write_csv(meps: List[MEP], filename: str = "meps.csv") -> None:
     """Write list of MEPs to a CSV file (semicolon-separated)."""
     if not meps:
         print("[WARN] No MEP data to write.")
         return
 
-    fieldnames = list(asdict(meps[0]).keys())
+    fieldnames = [f.name for f in fields(MEP)]
+    row_of = attrgetter(*fieldnames)
 
     with open(filename, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=";")
-        writer.writeheader()
-        for mep in meps:
-            writer.writerow(asdict(mep))
+        writer = csv.writer(f, delimiter=";")
+        writer.writerow(fieldnames)
+        writer.writerows(row_of(mep) for mep in meps)
 
     print(f"[INFO] Wrote {len(meps)} rows to {filename}")
 
@@ -272,8 +417,17 @@ def main():
         default="meps.csv",
         help="Output CSV filename (default: meps.csv).",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help=f"Clear the HTTP cache ({CACHE_NAME}.sqlite) before scraping.",
+    )
     args = parser.parse_args()
 
+    if args.refresh:
+        print(f"[INFO] Clearing HTTP cache: {CACHE_NAME}.sqlite")
+        SESSION.cache.clear()
+
     meps = scrape_all_meps(only_with_x=args.only_with_x)
     write_csv(meps, filename=args.output)
 
@@ -1,14 +1,14 @@
 #!/usr/bin/env python3
-import json
 from collections import Counter
 from pathlib import Path
 
+import orjson
+
 # Path to your JSON file
 DATA_PATH = Path("data/meps_all_with_overrides.json")
 
 def load_meps(path: Path):
-    with path.open(encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(path.read_bytes())
 
 def filter_meps_on_x(meps):
     """Keep only MEPs who are on X (usesX == True)."""
@@ -16,7 +16,7 @@ def filter_meps_on_x(meps):
 
 def rank_by_country(meps_on_x):
     """Return list of (country, count) sorted by count desc, then name."""
-    counts = Counter(m["country"] for m in meps_on_x if m.get("country"))
+    counts = Counter(c for c in (m.get("country") for m in meps_on_x) if c)
     return sorted(counts.items(), key=lambda x: (-x[1], x[0]))
 
 def rank_by_party(meps_on_x):
@@ -24,7 +24,7 @@ def rank_by_party(meps_on_x):
     Return list of (party, count) sorted by count desc, then name.
     Using the 'party' field; switch to 'euGroupFull' if you prefer that.
     """
-    counts = Counter(m["party"] for m in meps_on_x if m.get("party"))
+    counts = Counter(c for c in (m.get("party") for m in meps_on_x) if c)
     return sorted(counts.items(), key=lambda x: (-x[1], x[0]))
 
 def print_markdown_table(title, header_cols, rows):
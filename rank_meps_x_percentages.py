@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
-import json
 from collections import Counter, defaultdict
 from pathlib import Path
 
+import orjson
+
 # ========= CONFIGURE THIS IF NEEDED =========
 DATA_PATH = Path("data/meps_all_with_overrides.json")
 
@@ -16,56 +17,63 @@ FIELD_X_STATUS = "xStatus"   # expected values: "active", "inactive", "not_on_x"
 
 
 def load_meps(path: Path):
-    with path.open(encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(path.read_bytes())
 
 def is_active_on_x(mep):
     return mep.get(FIELD_X_STATUS) == "active"
 
-def compute_stats(meps, group_field):
+def compute_stats(meps, group_fields):
     """
-    Compute, for a given group field (e.g. 'country'):
+    Compute, for each given group field (e.g. 'country'), in a single pass:
       - total number of MEPs in each group
       - number of MEPs on X in each group
       - percentage on X
-    Returns a list of dicts with:
+    Returns a dict mapping each group field to a list of dicts with:
       { 'group': <name>, 'on_x': int, 'total': int, 'pct': float }
     """
-    totals = Counter()
-    on_x = Counter()
+    totals = defaultdict(Counter)
+    on_x = defaultdict(Counter)
 
-    for m in meps:
-        group = m.get(group_field)
-        if not group:  # skip if missing
-            continue
-        totals[group] += 1
-        status = m.get(FIELD_X_STATUS)
+    # Hoist global/attribute lookups out of the per-MEP loop
+    uses_x_key = FIELD_USES_X
+    status_key = FIELD_X_STATUS
+    field_counters = [(field, totals[field], on_x[field]) for field in group_fields]
 
+    for m in meps:
+        get = m.get
         # Count as "on X" if:
         # - usesX is True
         # - AND the person is not explicitly marked as inactive
-        if m.get(FIELD_USES_X) and status != "inactive":
-            on_x[group] += 1
-
-    results = []
-    for group, total in totals.items():
-        count_on_x = on_x[group]
-        pct = (count_on_x / total * 100) if total > 0 else 0.0
-        results.append(
+        counts_on_x = bool(get(uses_x_key)) and get(status_key) != "inactive"
+
+        for field, field_totals, field_on_x in field_counters:
+            group = get(field)
+            if not group:  # skip if missing
+                continue
+            field_totals[group] += 1
+            if counts_on_x:
+                field_on_x[group] += 1
+
+    stats = {}
+    for field, field_totals, field_on_x in field_counters:
+        results = [
             {
                 "group": group,
-                "on_x": count_on_x,
+                "on_x": field_on_x[group],
                 "total": total,
-                "pct": pct,
+                "pct": (field_on_x[group] / total * 100) if total > 0 else 0.0,
             }
-        )
+            for group, total in field_totals.items()
+        ]
 
-    # Sort:
-    # 1) percentage on X (desc)
-    # 2) MEPs on X (desc)
-    # 3) group name (asc)
-    results.sort(key=lambda r: (-r["pct"], -r["on_x"], r["group"]))
-    return results
+        # Sort:
+        # 1) percentage on X (desc)
+        # 2) MEPs on X (desc)
+        # 3) group name (asc)
+        results.sort(key=lambda r: (-r["pct"], -r["on_x"], r["group"]))
+        stats[field] = results
+
+    return stats
 
 
 def print_markdown_table(title, group_label, rows):
@@ -87,28 +95,28 @@ def print_markdown_table(title, group_label, rows):
 def main():
     meps = load_meps(DATA_PATH)
 
+    # Add FIELD_PARTY here to enable the national party ranking below
+    stats = compute_stats(meps, [FIELD_COUNTRY, FIELD_EU_GROUP])
+
     # Country ranking
-    country_stats = compute_stats(meps, FIELD_COUNTRY)
     print_markdown_table(
         "Ranking by country (share of MEPs on X)",
         "Country",
-        country_stats,
+        stats[FIELD_COUNTRY],
     )
 
     # National party ranking
-    # party_stats = compute_stats(meps, FIELD_PARTY)
     # print_markdown_table(
     #     "Ranking by national party (share of MEPs on X)",
     #     "Party",
-    #     party_stats,
+    #     stats[FIELD_PARTY],
     # )
 
     # EU group ranking
-    eu_group_stats = compute_stats(meps, FIELD_EU_GROUP)
     print_markdown_table(
         "Ranking by EU group (share of MEPs on X)",
         "EU group",
-        eu_group_stats,
+        stats[FIELD_EU_GROUP],
     )
 
 